@@ -1,5 +1,5 @@
-import asyncio
 import functools
+import inspect
 import re
 import sys
 from typing import Callable, TypeVar
@@ -14,6 +14,12 @@ from failures.core import NamePattern
 SPEC = ParamSpec('SPEC')
 RT = TypeVar('RT')
 
+# CamelCase to snake_case (source of code)
+# https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case
+_CAPITALIZED_WORD = re.compile('(.)([A-Z][a-z]+)')
+_DOUBLE_UNDERSCORE = re.compile('__([A-Z])')
+_LOWER_TO_UPPER = re.compile('([a-z0-9])([A-Z])')
+
 
 def is_async(func: Callable) -> bool:
     """
@@ -26,17 +32,26 @@ def is_async(func: Callable) -> bool:
     # https://github.com/encode/starlette/blob/4fdfad20abf8981e15babe015eb5d8330d9c7662/starlette/_utils.py#L13
     while isinstance(func, functools.partial):
         func = func.func
-    return asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(getattr(func, '__call__', None))
+    return _is_coroutine_function(func) or _is_coroutine_function(getattr(func, '__call__', None))
+
+
+def _is_coroutine_function(func) -> bool:
+    """Checks if func is a coroutine function without importing asyncio"""
+    # asyncio also recognizes its own coroutine markers (e.g. unittest.mock.AsyncMock),
+    # those can only exist if asyncio was already imported by the application
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is None:
+        return inspect.iscoroutinefunction(func)
+    return asyncio.iscoroutinefunction(func)
 
 
+@functools.lru_cache(maxsize=1024)
 def pascal_to_snake(name: str) -> str:
     """converts PascalCase names to snake_case names"""
     assert isinstance(name, str), "name must be a string"
-    # CamelCase to snake_case (source of code)
-    # https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    name = re.sub('__([A-Z])', r'_\1', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
+    name = _CAPITALIZED_WORD.sub(r'\1_\2', name)
+    name = _DOUBLE_UNDERSCORE.sub(r'_\1', name)
+    return _LOWER_TO_UPPER.sub(r'\1_\2', name)
 
 
 def validate_name(name: str) -> None:
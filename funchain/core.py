@@ -1,4 +1,3 @@
-import asyncio
 import functools
 import sys
 from abc import ABC, abstractmethod
@@ -22,6 +21,7 @@ else:
 from failures import Reporter, FailureException
 
 from ._tools import validate_name, is_async, get_function_name
+# asyncio is imported by the async code paths only, as it is heavy to import
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -146,12 +146,15 @@ class Node(BaseNode):
 
     def handle_failure(self, error: Exception, arg, reporter: Optional[Reporter]) -> Feedback:
         """Reports the failure according to the node severity"""
-        severity = self.severity
-        if reporter and (severity is Severity.NORMAL):
-            reporter(self.name).report(error, input=arg)
-        elif severity is Severity.REQUIRED:
+        severity = self._severity
+        if severity is Severity.OPTIONAL:
+            # Ignored failures never touch the reporter
+            return False, None
+        if severity is Severity.REQUIRED:
             reporter = (reporter or Reporter)(self.name)
             raise FailureException(reporter.failure(error, input=arg), reporter)
+        if reporter is not None:
+            reporter(self.name).report(error, input=arg)
         return False, None
 
 
@@ -166,6 +169,7 @@ class AsyncNode(Node):
             return self.handle_failure(error, arg, reporter)
 
     def proc(self, arg, reporter: Optional[Reporter]) -> Feedback:
+        import asyncio
         return asyncio.run(self.aproc(arg, reporter))
 
 
@@ -242,14 +246,14 @@ class Loop(WrapperNode):
             return self.node.proc(args, reporter)
         if not args:
             return True, []
-        successes: set[bool] = set()
+        succeeded = False
         results = []
         node = self.node
         for arg in args:
             success, res = node.proc(arg, reporter)
-            successes.add(success)
+            succeeded = succeeded or success
             results.append(res)
-        return (True in successes), results
+        return succeeded, results
 
     async def aproc(self, args: Iterable, /, reporter: Optional[Reporter]) -> Feedback:
         try:
@@ -258,6 +262,7 @@ class Loop(WrapperNode):
             return await self.node.aproc(args, reporter)
         if not args:
             return True, []
+        import asyncio
         node = self.node
         jobs = await asyncio.gather(*(asyncio.create_task(node.aproc(arg, reporter)) for arg in args))
         successes, results = zip(*jobs)
@@ -343,21 +348,22 @@ class NodeChain(NodeGroup):
 class NodeList(NodeGroup):
     """A node that processes the input through multiple branches and returns a list as a result"""
     def proc(self, arg, reporter: Optional[Reporter]) -> Feedback:
-        successes: set[bool] = set()
+        succeeded = False
         results = []
         for node in self._nodes:
             success, result = node.proc(arg, reporter)
             if not success:
                 if node.severity is Severity.OPTIONAL:
                     continue
-            successes.add(success)
+            succeeded = succeeded or success
             results.append(result)
-        if True in successes:
+        if succeeded:
             return True, results
         return False, None
 
     async def aproc(self, arg, /, reporter: Optional[Reporter]) -> Feedback:
-        successes: set[bool] = set()
+        import asyncio
+        succeeded = False
         results = []
         for (success, result), node in zip(
                 await asyncio.gather(
@@ -369,9 +375,9 @@ class NodeList(NodeGroup):
             if not success:
                 if node.severity is Severity.OPTIONAL:
                     continue
-            successes.add(success)
+            succeeded = succeeded or success
             results.append(result)
-        if True in successes:
+        if succeeded:
             return True, results
         return False, None
 
@@ -386,21 +392,22 @@ class NodeDict(NodeList):
         self._branches = tuple(branches)
 
     def proc(self, arg, reporter: Optional[Reporter]) -> Feedback:
-        successes: set[bool] = set()
+        succeeded = False
         results = {}
         for branch, node in zip(self._branches, self._nodes):
             success, result = node.proc(arg, reporter)
             if not success:
                 if node.severity is Severity.OPTIONAL:
                     continue
-            successes.add(success)
+            succeeded = succeeded or success
             results[branch] = result
-        if True in successes:
+        if succeeded:
             return True, results
         return False, None
 
     async def aproc(self, arg, /, reporter: Optional[Reporter]) -> Feedback:
-        successes: set[bool] = set()
+        import asyncio
+        succeeded = False
         results = {}
         for (success, result), node, branch in zip(
                 await asyncio.gather(
@@ -413,9 +420,9 @@ class NodeDict(NodeList):
             if not success:
                 if node.severity is Severity.OPTIONAL:
                     continue
-            successes.add(success)
+            succeeded = succeeded or success
             results[branch] = result
-        if True in successes:
+        if succeeded:
             return True, results
         return False, None
 
@@ -0,0 +1,16 @@
+import pytest
+
+from funchain._tools import pascal_to_snake
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("lambda", "lambda"),
+    ("already_snake", "already_snake"),
+    ("Add", "Add"),
+    ("Add(3)", "Add(3)"),
+    ("MyFunction", "My_Function"),
+    ("HTTPError", "HTTP_Error"),
+    ("getHTTPResponseCode", "get_HTTP_Response_Code"),
+])
+def test_pascal_to_snake(name, expected):
+    assert pascal_to_snake(name) == expected, "name was not converted as expected"